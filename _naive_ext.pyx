@@ -0,0 +1,33 @@
+# cython: boundscheck=False, wraparound=False
+# cython: language_level=3
+"""
+Optional C extension for the positions-only matching path.
+
+Build in place with:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+final.py falls back to its pure-Python implementation when this module
+is not built, so the extension is never required.
+"""
+
+
+cpdef list match_positions(const unsigned char[::1] t, const unsigned char[::1] p):
+    """
+    All positions where pattern p occurs in text t, via the naïve
+    nested loop compiled to C with typed memoryviews.
+    """
+    cdef Py_ssize_t n = t.shape[0]
+    cdef Py_ssize_t m = p.shape[0]
+    cdef Py_ssize_t i, j
+    cdef list matches = []
+
+    for i in range(n - m + 1):
+        j = 0
+        while j < m and t[i + j] == p[j]:
+            j += 1
+        if j == m:
+            matches.append(i)
+
+    return matches
@@ -1,87 +1,648 @@
 import streamlit as st
 import time
+import html
+import operator
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is an optional accelerator
+    _HAVE_NUMBA = False
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:  # fall back to one short sleep per auto-play frame
+    st_autorefresh = None
+
+try:
+    from _naive_ext import match_positions as _match_positions_c
+except ImportError:  # optional Cython extension (see setup.py)
+    _match_positions_c = None
+
+# Precompiled highlight templates; characters are escaped before being
+# dropped in, so <, > and & in the inputs cannot break out of the markup
+_GREEN = "<span style='background-color: #90EE90; padding: 2px;'>{}</span>"
+_PINK = "<span style='background-color: #FFB6C1; padding: 2px;'>{}</span>"
+
+# Constant UI content.  Note that Streamlit re-executes this script on
+# every rerun, so anything expensive built from these (e.g. the
+# comparison DataFrame) still goes through a cached helper.
+_COMPARISON_DATA = {
+    'Algorithm': ['Naïve', 'KMP', 'Boyer-Moore', 'Rabin-Karp'],
+    'Time Complexity': ['O(n×m)', 'O(n+m)', 'O(n/m) best, O(n×m) worst', 'O(n+m) average'],
+    'Space Complexity': ['O(1)', 'O(m)', 'O(m)', 'O(1)'],
+    'Preprocessing': ['None', 'O(m)', 'O(m+σ)', 'O(m)'],
+    'Best Use Case': ['Small patterns', 'General purpose', 'Large alphabets', 'Multiple patterns']
+}
+
+_TIME_COMPLEXITY_MD = (
+    "• Best Case: O(n) - pattern found at the beginning  \n"
+    "• Average Case: O(n×m)  \n"
+    "• Worst Case: O(n×m) - pattern not found or found at the end"
+)
+
+_SPACE_COMPLEXITY_MD = "• O(1) - constant extra space"
+
+_CHARACTERISTICS_MD = (
+    "• Simple to implement  \n"
+    "• No preprocessing required  \n"
+    "• Can be inefficient for large inputs"
+)
+
+def _find_match_positions(text, pattern):
+    """
+    Enumerate match positions with str.find — CPython's C-level two-way
+    search — jumping from match to match in one linear pass.
+    """
+    matches = []
+    start = 0
+    while True:
+        pos = text.find(pattern, start)
+        if pos < 0:
+            break
+        matches.append(pos)
+        start = pos + 1
+    return matches
+
+def _scan_kernel(text, pattern, starts, log, cum, match_pos):
+    """
+    Core scan loop: fills the compact comparison log instead of building
+    per-comparison dicts.  Each log row is (start_pos, pattern_pos, match);
+    starts[s] is the first log row of step s, cum[s] the running comparison
+    total after step s.  Runs of consecutive positions whose first
+    character mismatches are collapsed into one skip row
+    (run_start, run_length, -2) — one comparison per skipped position,
+    one step for the whole run.  Written in numba-compatible style so the
+    same function runs JIT-compiled on uint8 arrays or as plain Python on
+    str.  Returns (num_steps, num_matches, comparisons).
+    """
+    n = len(text)
+    m = len(pattern)
+
+    k = 0
+    s = 0
+    comparisons = 0
+    num_matches = 0
+    last_start = n - m
+
+    i = 0
+    while i <= last_start:
+        if text[i] != pattern[0]:
+            run_start = i
+            while i <= last_start and text[i] != pattern[0]:
+                i += 1
+
+            starts[s] = k
+            log[k, 0] = run_start
+            log[k, 1] = i - run_start
+            log[k, 2] = -2
+            k += 1
+            comparisons += i - run_start
+            cum[s] = comparisons
+            s += 1
+
+            if i > last_start:
+                break
+
+        starts[s] = k
+        current_match = True
+
+        for j in range(m):
+            comparisons += 1
+            char_match = text[i + j] == pattern[j]
+            log[k, 0] = i
+            log[k, 1] = j
+            log[k, 2] = 1 if char_match else 0
+            k += 1
+
+            if not char_match:
+                current_match = False
+                break
+
+        cum[s] = comparisons
+        s += 1
+
+        if current_match:
+            match_pos[num_matches] = i
+            num_matches += 1
+
+        i += 1
+
+    starts[s] = k
+    return s, num_matches, comparisons
+
+if _HAVE_NUMBA:
+    _scan = njit(cache=True)(_scan_kernel)
+
+# Below this much total work the NumPy engines lose to plain Python on
+# setup overhead
+_NUMPY_MIN_WORK = 10_000
+
+# Above this much total work the step-by-step view is disabled and only
+# the (vectorized) summary is computed
+_STEP_RECORD_LIMIT = 100_000
+
+def _scan_py_numpy(tb, pb, starts, log, cum, match_pos):
+    """
+    Vectorized scan used on large ASCII input when numba is unavailable.
+    One C-level pass finds the candidate positions where the first byte
+    matches; everything else is a guaranteed mismatch at pattern position
+    0.  Candidates are then verified in bulk over a sliding window view,
+    which also yields each candidate's first mismatch position.  Every
+    step compresses to a single log row — (i, j, -1) for "j matching
+    comparisons then a mismatch", (i, m, 2) for a full match, or
+    (i, run_length, -2) for a whole run of non-candidate positions — so
+    the expanded steps and comparison counts are identical to the other
+    engines.
+    """
+    n = len(tb)
+    m = len(pb)
+    num_positions = n - m + 1
+
+    T = np.frombuffer(tb, np.uint8)
+    P = np.frombuffer(pb, np.uint8)
+
+    candidates = np.flatnonzero(T[:num_positions] == P[0])
+    windows = np.lib.stride_tricks.sliding_window_view(T, m)[candidates]
+    mismatch = windows != P
+    full_match = ~mismatch.any(axis=1)
+    first_mismatch = np.argmax(mismatch, axis=1).astype(np.int32)
+    matched_at = candidates[full_match]
+
+    # One step per candidate: fast-reject sentinel or compressed match
+    cand_rows = np.empty((len(candidates), 3), np.int32)
+    cand_rows[:, 0] = candidates
+    cand_rows[:, 1] = np.where(full_match, m, first_mismatch)
+    cand_rows[:, 2] = np.where(full_match, 2, -1)
+    cand_cost = np.where(full_match, m, first_mismatch + 1)
+
+    # One skip step per run of non-candidate positions
+    bounds = np.concatenate(([-1], candidates, [num_positions]))
+    gap_start = bounds[:-1] + 1
+    gap_len = bounds[1:] - gap_start
+    keep = gap_len > 0
+    gap_start = gap_start[keep]
+    gap_len = gap_len[keep]
+    gap_rows = np.empty((len(gap_start), 3), np.int32)
+    gap_rows[:, 0] = gap_start
+    gap_rows[:, 1] = gap_len
+    gap_rows[:, 2] = -2
+
+    rows = np.concatenate([cand_rows, gap_rows])
+    costs = np.concatenate([cand_cost, gap_len])
+    order = np.argsort(rows[:, 0], kind='stable')
+    rows = rows[order]
+    costs = costs[order]
+
+    num_steps = len(rows)
+    log[:num_steps] = rows
+    starts[:num_steps + 1] = np.arange(num_steps + 1, dtype=np.int32)
+    cum[:num_steps] = np.cumsum(costs)
+    match_pos[:len(matched_at)] = matched_at
+
+    return num_steps, len(matched_at), int(costs.sum())
+
+def _scan_py_swar(tb, pb, starts, log, cum, match_pos):
+    """
+    Pure-Python scan used on ASCII input when numba is unavailable.
+    bytes.find (C-level) jumps straight to the next position where the
+    first pattern byte occurs, logging the skipped run as one skip row
+    (run_start, run_length, -2).  At candidate positions the first
+    (up to) 8 pattern bytes are checked with a single word comparison
+    (SWAR); the first differing byte is recovered from the XOR, so
+    comparison counts stay identical to the per-character scan.
+    Fast-rejected candidates are logged as one sentinel row
+    (start_pos, mismatch_pos, -1) that build_step expands back into
+    individual comparisons.
+    """
+    n = len(tb)
+    m = len(pb)
+
+    first = pb[0]
+    word_len = min(m, 8)
+    pattern_word = int.from_bytes(pb[:8], 'little')
+    word_mask = (1 << (8 * word_len)) - 1
+
+    k = 0
+    s = 0
+    comparisons = 0
+    num_matches = 0
+    last_start = n - m
+
+    i = 0
+    while i <= last_start:
+        if tb[i] != first:
+            # Skip ahead to the next first-byte occurrence in one C call
+            nxt = tb.find(first, i, last_start + 1)
+            run_start = i
+            i = last_start + 1 if nxt < 0 else nxt
+
+            starts[s] = k
+            log[k, 0] = run_start
+            log[k, 1] = i - run_start
+            log[k, 2] = -2
+            k += 1
+            comparisons += i - run_start
+            cum[s] = comparisons
+            s += 1
+
+            if i > last_start:
+                break
+
+        starts[s] = k
+        diff = (int.from_bytes(tb[i:i + 8], 'little') & word_mask) ^ pattern_word
+
+        if diff:
+            # Lowest differing byte is the first mismatch position
+            d = ((diff & -diff).bit_length() - 1) // 8
+            comparisons += d + 1
+            log[k, 0] = i
+            log[k, 1] = d
+            log[k, 2] = -1
+            k += 1
+            cum[s] = comparisons
+            s += 1
+            i += 1
+            continue
+
+        current_match = True
+        for j in range(m):
+            comparisons += 1
+            char_match = tb[i + j] == pb[j]
+            log[k, 0] = i
+            log[k, 1] = j
+            log[k, 2] = 1 if char_match else 0
+            k += 1
+
+            if not char_match:
+                current_match = False
+                break
+
+        cum[s] = comparisons
+        s += 1
+
+        if current_match:
+            match_pos[num_matches] = i
+            num_matches += 1
+
+        i += 1
+
+    starts[s] = k
+    return s, num_matches, comparisons
+
+@st.cache_data(show_spinner=False, max_entries=32)
 def naive_string_matching_with_steps(text, pattern):
     """
-    Naïve string matching algorithm that returns all steps for visualization
+    Naïve string matching algorithm that records every comparison in
+    compact int32 arrays for visualization.  The result is a pure
+    function of (text, pattern), so it is memoized across Streamlit
+    reruns — slider drags and tab switches no longer re-run the scan.
+    Returns
+    (starts, log, cum, num_steps, matches, comparisons); use build_step()
+    to materialize the dict for a single step on demand.
+    """
+    n = len(text)
+    m = len(pattern)
+    num_positions = n - m + 1
+
+    starts = np.zeros(num_positions + 1, np.int32)
+    log = np.empty((num_positions * m, 3), np.int32)
+    cum = np.empty(num_positions, np.int32)
+    match_pos = np.empty(num_positions, np.int32)
+
+    if text.isascii() and pattern.isascii():
+        if _HAVE_NUMBA:
+            T = np.frombuffer(text.encode(), np.uint8)
+            P = np.frombuffer(pattern.encode(), np.uint8)
+            num_steps, num_matches, comparisons = _scan(T, P, starts, log, cum, match_pos)
+        elif n * m >= _NUMPY_MIN_WORK:
+            num_steps, num_matches, comparisons = _scan_py_numpy(
+                text.encode(), pattern.encode(), starts, log, cum, match_pos)
+        else:
+            num_steps, num_matches, comparisons = _scan_py_swar(
+                text.encode(), pattern.encode(), starts, log, cum, match_pos)
+    else:
+        num_steps, num_matches, comparisons = _scan_kernel(text, pattern, starts, log, cum, match_pos)
+
+    matches = match_pos[:num_matches].tolist()
+    return starts, log, cum, int(num_steps), matches, int(comparisons)
+
+def _match_positions_py(tb, pb):
+    """
+    Positions-only scan for small inputs: the per-window equality check
+    runs entirely in C-level map/all over a memoryview, with no Python
+    inner loop.
+    """
+    n = len(tb)
+    m = len(pb)
+    eq = operator.eq
+    view = memoryview(tb)
+    return [i for i in range(n - m + 1) if all(map(eq, view[i:i + m], pb))]
+
+def match_positions(text, pattern):
+    """
+    Match positions only — no comparison counts, no step data.  ASCII
+    inputs go through the Cython extension when it is built, or the
+    map/all pipeline when they are small; everything else uses str.find,
+    whose C implementation outruns any Python-level scan.
+    """
+    if text.isascii() and pattern.isascii():
+        if _match_positions_c is not None:
+            return _match_positions_c(text.encode(), pattern.encode())
+        if len(text) * len(pattern) < _NUMPY_MIN_WORK:
+            return _match_positions_py(text.encode(), pattern.encode())
+
+    return _find_match_positions(text, pattern)
+
+def count_matches(text, pattern):
+    """
+    Summary-only entry point: match positions, exact naïve comparison
+    count and window-position count without materializing any step data.
+    Works in O(m) vectorized passes over the text; non-ASCII inputs fall
+    back to the (cached) step recorder.  Note the last element counts
+    window positions, not recorder steps — the recorder collapses runs
+    of first-character mismatches into single skip steps.
+    """
+    n = len(text)
+    m = len(pattern)
+
+    if not (text.isascii() and pattern.isascii()):
+        _, _, _, num_steps, matches, comparisons = naive_string_matching_with_steps(text, pattern)
+        return matches, comparisons, num_steps
+
+    T = np.frombuffer(text.encode(), np.uint8)
+    P = np.frombuffer(pattern.encode(), np.uint8)
+    num_positions = n - m + 1
+
+    # The naïve scan compares pattern position j only where positions
+    # 0..j-1 all matched, so summing the surviving mask per round gives
+    # the exact comparison count.
+    alive = np.ones(num_positions, bool)
+    comparisons = 0
+    for j in range(m):
+        comparisons += int(np.count_nonzero(alive))
+        alive &= T[j:j + num_positions] == P[j]
+        if not alive.any():
+            break
+
+    return np.flatnonzero(alive).tolist(), comparisons, num_positions
+
+class _AhoCorasick:
+    """
+    Minimal Aho-Corasick automaton: one pass over the text finds every
+    occurrence of every pattern — O(n + Σm + #matches) instead of one
+    naïve scan per pattern.  Pure Python so the app has no extra
+    dependency; the goto/fail/output tables double as the data for the
+    automaton view in the UI.
+    """
+
+    def __init__(self, patterns):
+        self.goto = [{}]      # node -> {char: next node}
+        self.fail = [0]       # node -> longest proper suffix node
+        self.output = [[]]    # node -> patterns ending here
+        self.prefix = ['']    # node -> string spelled on the path from root
+
+        for pat in patterns:
+            self._add(pat)
+        self._build_failure_links()
+
+    def _add(self, pat):
+        node = 0
+        for ch in pat:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.prefix.append(self.prefix[node] + ch)
+                nxt = len(self.goto) - 1
+                self.goto[node][ch] = nxt
+            node = nxt
+        self.output[node].append(pat)
+
+    def _build_failure_links(self):
+        # Breadth-first: a node's failure link is already final when its
+        # children are processed
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.output[nxt] += self.output[self.fail[nxt]]
+
+    def iter_matches(self, text):
+        """
+        Yield (position, pattern) for every occurrence in one pass.
+        """
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            for pat in self.output[node]:
+                yield i - len(pat) + 1, pat
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def multi_pattern_matches(text, patterns):
+    """
+    Positions of every pattern in one Aho-Corasick pass, as a dict
+    pattern -> sorted list of start positions.
+    """
+    found = {pat: [] for pat in patterns}
+    for pos, pat in _AhoCorasick(patterns).iter_matches(text):
+        found[pat].append(pos)
+    return found
+
+def _iter_steps(get_step, num_steps, start=0):
+    """
+    Lazily yield step dicts from a step accessor; only the step
+    currently being rendered is ever materialized.
+    """
+    for s in range(start, num_steps):
+        yield get_step(s)
+
+def _comparison(text, pattern, i, j, char_match):
+    """
+    Single comparison dict for step position i, pattern position j.
+    """
+    return {
+        'text_pos': i + j,
+        'pattern_pos': j,
+        'text_char': text[i + j],
+        'pattern_char': pattern[j],
+        'match': char_match
+    }
+
+def build_step(text, pattern, starts, log, cum, step_index):
+    """
+    Materialize the step dict for one step from the compact comparison log.
+    Only the step actually being displayed pays the dict-building cost.
+    """
+    m = len(pattern)
+    rows = log[starts[step_index]:starts[step_index + 1]]
+
+    if rows[0, 2] == -2:
+        # Skip step: a run of positions whose first comparison fails
+        run_start = int(rows[0, 0])
+        run_len = int(rows[0, 1])
+        return {
+            'start_pos': run_start,
+            'skip_to': run_start + run_len,
+            'kind': 'skip',
+            'comparisons': [],
+            'is_match': False,
+            'total_comparisons': int(cum[step_index])
+        }
+
+    comparisons = []
+    for i, j, char_match in rows.tolist():
+        if char_match == 2:
+            # Compressed full match: all m comparisons succeeded
+            for jj in range(m):
+                comparisons.append(_comparison(text, pattern, i, jj, True))
+        elif char_match == -1:
+            # Fast reject: bytes 0..j-1 matched, byte j mismatched
+            for jj in range(j):
+                comparisons.append(_comparison(text, pattern, i, jj, True))
+            comparisons.append(_comparison(text, pattern, i, j, False))
+        else:
+            comparisons.append(_comparison(text, pattern, i, j, bool(char_match)))
+
+    return {
+        'start_pos': int(rows[0, 0]),
+        'comparisons': comparisons,
+        'is_match': len(comparisons) == m and comparisons[-1]['match'],
+        'total_comparisons': int(cum[step_index])
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def boyer_moore_horspool_with_steps(text, pattern):
+    """
+    Boyer-Moore-Horspool matching with step recording.  Uses the
+    bad-character rule to shift the pattern by more than one position
+    after each attempt, so it touches far fewer characters than the
+    naïve scan on average.  Steps use the same dict schema as
+    build_step() plus a 'shift' field, so the visualization works
+    unchanged.
     """
     steps = []
     matches = []
     comparisons = 0
-    
+
     n = len(text)
     m = len(pattern)
-    
-    for i in range(n - m + 1):
+
+    # Bad-character table: how far the last window character lets us shift.
+    # Characters absent from pattern[:-1] allow a full shift of m.
+    # For ASCII input the loop runs over bytes: indexing bytes yields a
+    # cached small int instead of allocating a 1-char str per comparison.
+    if text.isascii() and pattern.isascii():
+        tb = text.encode()
+        pb = pattern.encode()
+        shift_table = np.full(256, m, np.int32)
+        shift_table[np.frombuffer(pb[:-1], np.uint8)] = \
+            m - 1 - np.arange(m - 1, dtype=np.int32)
+
+        def _shift_for(last):
+            return int(shift_table[last])
+    else:
+        tb = text
+        pb = pattern
+        shift_map = {pattern[k]: m - 1 - k for k in range(m - 1)}
+
+        def _shift_for(last):
+            return shift_map.get(last, m)
+
+    i = 0
+    while i <= n - m:
         step_comparisons = []
         current_match = True
-        
+
         for j in range(m):
             comparisons += 1
-            char_match = text[i + j] == pattern[j]
-            step_comparisons.append({
-                'text_pos': i + j,
-                'pattern_pos': j,
-                'text_char': text[i + j],
-                'pattern_char': pattern[j],
-                'match': char_match
-            })
-            
+            char_match = tb[i + j] == pb[j]
+            step_comparisons.append(_comparison(text, pattern, i, j, char_match))
+
             if not char_match:
                 current_match = False
                 break
-        
+
+        step_shift = _shift_for(tb[i + m - 1])
         steps.append({
             'start_pos': i,
             'comparisons': step_comparisons,
-            'is_match': current_match and len(step_comparisons) == m,
-            'total_comparisons': comparisons
+            'is_match': current_match,
+            'total_comparisons': comparisons,
+            'shift': step_shift
         })
-        
-        if current_match and len(step_comparisons) == m:
+
+        if current_match:
             matches.append(i)
-    
+
+        i += step_shift
+
     return steps, matches, comparisons
 
 def visualize_step(text, pattern, step, step_num):
     """
     Create a visual representation of the current step
     """
+    if step.get('kind') == 'skip':
+        first = step['start_pos']
+        last = step['skip_to'] - 1
+        st.subheader(f"Step {step_num + 1}: Skipping positions {first}–{last}")
+
+        parts = []
+        for i, char in enumerate(text):
+            escaped = html.escape(char)
+            parts.append(_PINK.format(escaped) if first <= i <= last else escaped)
+        st.markdown("*Text:*")
+        st.markdown(f"<div style='font-family: monospace; font-size: 18px;'>{''.join(parts)}</div>", unsafe_allow_html=True)
+
+        st.info(f"❌ '{pattern[0]}' does not occur at these {last - first + 1} window starts, "
+                "so the first comparison fails at every one of them — skipped in a single step.")
+        st.write(f"*Total comparisons so far:* {step['total_comparisons']}")
+        return
+
     st.subheader(f"Step {step_num + 1}: Checking position {step['start_pos']}")
-    
-    # Create text display with highlighting
-    text_display = ""
-    pattern_display = ""
-    
+
+    # Index the comparisons once instead of rescanning them per character
+    pos_to_comp = {comp['text_pos']: comp for comp in step['comparisons']}
+    pat_to_comp = {comp['pattern_pos']: comp for comp in step['comparisons']}
+
     # Build the text display
+    parts = []
     for i, char in enumerate(text):
-        if any(comp['text_pos'] == i for comp in step['comparisons']):
-            # This character is being compared
-            comp = next(comp for comp in step['comparisons'] if comp['text_pos'] == i)
-            if comp['match']:
-                text_display += f"<span style='background-color: #90EE90; padding: 2px;'>{char}</span>"
-            else:
-                text_display += f"<span style='background-color: #FFB6C1; padding: 2px;'>{char}</span>"
+        comp = pos_to_comp.get(i)
+        if comp is None:
+            parts.append(html.escape(char))
+        elif comp['match']:
+            parts.append(_GREEN.format(html.escape(char)))
         else:
-            text_display += char
-    
+            parts.append(_PINK.format(html.escape(char)))
+    text_display = ''.join(parts)
+
     # Build the pattern display with alignment
-    pattern_position = step['start_pos']
-    pattern_display = " " * pattern_position
-    
+    parts = [" " * step['start_pos']]
     for j, char in enumerate(pattern):
-        if j < len(step['comparisons']):
-            comp = step['comparisons'][j]
-            if comp['match']:
-                pattern_display += f"<span style='background-color: #90EE90; padding: 2px;'>{char}</span>"
-            else:
-                pattern_display += f"<span style='background-color: #FFB6C1; padding: 2px;'>{char}</span>"
+        comp = pat_to_comp.get(j)
+        if comp is None:
+            parts.append(html.escape(char))
+        elif comp['match']:
+            parts.append(_GREEN.format(html.escape(char)))
         else:
-            pattern_display += char
-    
+            parts.append(_PINK.format(html.escape(char)))
+    pattern_display = ''.join(parts)
+
     # Display
     st.markdown("*Text:*")
     st.markdown(f"<div style='font-family: monospace; font-size: 18px;'>{text_display}</div>", unsafe_allow_html=True)
@@ -96,6 +657,8 @@ def visualize_step(text, pattern, step, step_num):
     
     if step['is_match']:
         st.success(f"✅ *MATCH FOUND* at position {step['start_pos']}!")
+    elif step.get('shift', 1) > 1:
+        st.info(f"❌ No match here; the bad-character rule shifts the pattern by {step['shift']} positions.")
     else:
         st.info("❌ No match at this position, moving to next position.")
     
@@ -111,30 +674,27 @@ def analyze_complexity(text_length, pattern_length):
     
     with col1:
         st.markdown("*Time Complexity:*")
-        st.write("• Best Case: O(n) - pattern found at the beginning")
-        st.write("• Average Case: O(n×m)")
-        st.write("• Worst Case: O(n×m) - pattern not found or found at the end")
+        st.markdown(_TIME_COMPLEXITY_MD)
         st.write(f"• Current input: O({text_length} × {pattern_length}) = O({text_length * pattern_length})")
-    
+
     with col2:
         st.markdown("*Space Complexity:*")
-        st.write("• O(1) - constant extra space")
+        st.markdown(_SPACE_COMPLEXITY_MD)
         st.markdown("*Characteristics:*")
-        st.write("• Simple to implement")
-        st.write("• No preprocessing required")
-        st.write("• Can be inefficient for large inputs")
+        st.markdown(_CHARACTERISTICS_MD)
 
-def generate_performance_chart():
+@st.cache_resource(show_spinner=False)
+def _performance_figure():
     """
-    Generate a performance comparison chart
+    Build the (constant) performance comparison figure once per process.
+    Cached as a resource: matplotlib figures are not reliably picklable,
+    and sharing the one instance avoids a copy per rerun.
     """
-    st.subheader("Performance Visualization")
-    
     # Generate data for different input sizes
     sizes = [10, 20, 50, 100, 200, 500]
     comparisons_best = sizes  # Best case: O(n)
     comparisons_worst = [n * 5 for n in sizes]  # Worst case with pattern length 5
-    
+
     fig, ax = plt.subplots(figsize=(10, 6))
     ax.plot(sizes, comparisons_best, label='Best Case O(n)', marker='o', color='green')
     ax.plot(sizes, comparisons_worst, label='Worst Case O(n×m)', marker='s', color='red')
@@ -143,8 +703,71 @@ def generate_performance_chart():
     ax.set_title('Naïve String Matching: Best vs Worst Case Performance')
     ax.legend()
     ax.grid(True, alpha=0.3)
-    
-    st.pyplot(fig)
+
+    return fig
+
+def generate_performance_chart():
+    """
+    Generate a performance comparison chart
+    """
+    st.subheader("Performance Visualization")
+    st.pyplot(_performance_figure())
+
+@st.cache_data(show_spinner=False)
+def _comparison_df():
+    """
+    Build the (constant) algorithm comparison table once per process.
+    """
+    return pd.DataFrame(_COMPARISON_DATA)
+
+def visualize_multi_pattern(text, patterns):
+    """
+    Results view for multi-pattern mode: per-pattern match table from a
+    single Aho-Corasick pass, plus a look inside the automaton.
+    """
+    found = multi_pattern_matches(text, patterns)
+    total = sum(len(positions) for positions in found.values())
+
+    st.header("Results Summary")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Text Length", len(text))
+    with col2:
+        st.metric("Patterns", len(patterns))
+    with col3:
+        st.metric("Total Matches", total)
+
+    if total:
+        st.success(f"✅ Found {total} match(es) across {len(patterns)} pattern(s) in a single pass.")
+    else:
+        st.info("❌ None of the patterns occur in the text.")
+
+    tab1, tab2 = st.tabs(["Matches", "Automaton"])
+
+    with tab1:
+        st.dataframe(pd.DataFrame({
+            'Pattern': list(patterns),
+            'Matches': [len(found[p]) for p in patterns],
+            'Positions': [', '.join(map(str, found[p])) or '—' for p in patterns]
+        }))
+        st.caption("The text is scanned once for all patterns: "
+                   "O(n + Σm + matches) instead of one O(n×m) scan per pattern.")
+
+    with tab2:
+        st.subheader("Aho-Corasick Automaton")
+        ac = _AhoCorasick(patterns)
+        st.dataframe(pd.DataFrame({
+            'Node': range(len(ac.goto)),
+            'Prefix': [prefix or '(root)' for prefix in ac.prefix],
+            'Edges': [', '.join(f"'{ch}'→{nxt}" for ch, nxt in edges.items()) or '—'
+                      for edges in ac.goto],
+            'Failure → Node': ac.fail,
+            'Outputs': [', '.join(out) or '—' for out in ac.output]
+        }))
+        st.caption("A failure link jumps to the longest suffix of the current "
+                   "prefix that is also a pattern prefix, so no text character "
+                   "is ever rescanned.")
 
 def main():
     st.set_page_config(page_title="Naïve String Matching Simulator", layout="wide")
@@ -167,6 +790,11 @@ def main():
     }
     
     selected_example = st.sidebar.selectbox("Choose an example:", list(examples.keys()))
+
+    algorithm = st.sidebar.radio("Algorithm:", ["Naïve", "Boyer-Moore-Horspool"])
+    multi_pattern = st.sidebar.checkbox(
+        "Multi-pattern mode (comma-separated patterns)",
+        help="Searches all patterns in one Aho-Corasick pass over the text.")
     
     if selected_example == "Custom":
         text = st.sidebar.text_input("Enter text:", value="ABAAABCDABABCABCABCDAB")
@@ -179,13 +807,43 @@ def main():
     if not text or not pattern:
         st.warning("Please enter both text and pattern.")
         return
-    
+
+    if multi_pattern:
+        patterns = tuple(dict.fromkeys(p.strip() for p in pattern.split(',') if p.strip()))
+        if not patterns:
+            st.warning("Please enter at least one pattern.")
+            return
+        visualize_multi_pattern(text, patterns)
+        return
+
     if len(pattern) > len(text):
         st.error("Pattern cannot be longer than text.")
         return
     
-    # Run the algorithm
-    steps, matches, total_comparisons = naive_string_matching_with_steps(text, pattern)
+    # Run the selected algorithm (the step recorder feeds the step-by-step
+    # tab; the vectorized scan is the fast source of truth for the summary).
+    # Past the recording limit only the summary is computed, so large
+    # inputs never allocate the comparison log.
+    record_steps = len(text) * len(pattern) <= _STEP_RECORD_LIMIT
+
+    if not record_steps:
+        matches = match_positions(text, pattern)
+        _, total_comparisons, _ = count_matches(text, pattern)
+        num_steps = 0
+        get_step = None
+    elif algorithm == "Boyer-Moore-Horspool":
+        bmh_steps, matches, total_comparisons = boyer_moore_horspool_with_steps(text, pattern)
+        num_steps = len(bmh_steps)
+
+        def get_step(s):
+            return bmh_steps[s]
+    else:
+        matches = match_positions(text, pattern)
+        _, total_comparisons, _ = count_matches(text, pattern)
+        starts, log, cum, num_steps, _, _ = naive_string_matching_with_steps(text, pattern)
+
+        def get_step(s):
+            return build_step(text, pattern, starts, log, cum, s)
     
     # Display results summary
     st.header("Results Summary")
@@ -199,7 +857,10 @@ def main():
         st.metric("Matches Found", len(matches))
     with col4:
         st.metric("Total Comparisons", total_comparisons)
-    
+
+    if not record_steps and algorithm == "Boyer-Moore-Horspool":
+        st.caption("Comparison count shown for the naïve scan; step recording is disabled for inputs this large.")
+
     if matches:
         st.success(f"✅ Pattern found at positions: {matches}")
     else:
@@ -210,34 +871,75 @@ def main():
     
     with tab1:
         st.header("Step-by-Step Execution")
-        
-        # Control buttons
-        col1, col2, col3 = st.columns([1, 1, 2])
-        
-        with col1:
-            auto_play = st.button("▶ Auto Play All Steps")
-        
-        with col2:
-            show_all = st.button("📋 Show All Steps")
-        
-        if auto_play:
-            placeholder = st.empty()
-            for i, step in enumerate(steps):
-                with placeholder.container():
-                    visualize_step(text, pattern, step, i)
-                    st.markdown("---")
-                time.sleep(2)  # Pause between steps
-        
-        elif show_all:
-            for i, step in enumerate(steps):
-                with st.expander(f"Step {i + 1}: Position {step['start_pos']} {'✅' if step['is_match'] else '❌'}"):
-                    visualize_step(text, pattern, step, i)
-        
+
+        if not record_steps:
+            st.info(f"Step-by-step visualization is disabled for large inputs "
+                    f"(text length × pattern length above {_STEP_RECORD_LIMIT:,}). "
+                    "The summary above is still exact — try a shorter custom input to explore the steps.")
         else:
-            # Step selector
-            if steps:
-                step_num = st.slider("Select step to visualize:", 0, len(steps) - 1, 0)
-                visualize_step(text, pattern, steps[step_num], step_num)
+            # Control buttons
+            col1, col2, col3 = st.columns([1, 1, 2])
+
+            with col1:
+                auto_play = st.button("▶ Auto Play All Steps")
+
+            with col2:
+                # A toggle rather than a button so the view survives the
+                # rerun caused by switching pages
+                show_all = st.toggle("📋 Show All Steps")
+
+            # Auto-play renders one frame per rerun driven by session state,
+            # so the server thread is never held for the whole animation and
+            # the user can stop midway
+            if auto_play:
+                st.session_state.auto_play_idx = 0
+                st.session_state.auto_play_running = True
+
+            if st.session_state.get('auto_play_running', False):
+                if st.button("⏹ Stop Auto Play"):
+                    st.session_state.auto_play_running = False
+
+            if st.session_state.get('auto_play_running', False):
+                idx = min(st.session_state.auto_play_idx, num_steps - 1)
+                visualize_step(text, pattern, get_step(idx), idx)
+                st.caption(f"Auto-playing step {idx + 1} of {num_steps}")
+
+                if idx + 1 < num_steps:
+                    st.session_state.auto_play_idx = idx + 1
+                    if st_autorefresh is not None:
+                        st_autorefresh(interval=2000, key="autoplay")
+                    else:
+                        time.sleep(2)  # Pause between steps
+                        st.rerun()
+                else:
+                    st.session_state.auto_play_running = False
+                    st.success("✅ Auto-play complete.")
+
+            elif show_all:
+                # Paginate so the DOM stays a constant size: thousands of
+                # expanders per rerun would overwhelm the browser
+                page_size = 50
+                num_pages = (num_steps - 1) // page_size + 1
+                page = 1
+                if num_pages > 1:
+                    page = st.number_input(f"Page (of {num_pages}, {page_size} steps each):",
+                                           min_value=1, max_value=num_pages, value=1)
+                start = (page - 1) * page_size
+                stop = min(start + page_size, num_steps)
+
+                for i, step in enumerate(_iter_steps(get_step, stop, start), start=start):
+                    with st.expander(f"Step {i + 1}: Position {step['start_pos']} {'✅' if step['is_match'] else '❌'}"):
+                        visualize_step(text, pattern, step, i)
+
+            else:
+                # Step selector (st.slider requires min < max, and skip
+                # collapsing can reduce the whole scan to a single step)
+                if num_steps > 1:
+                    step_num = st.slider("Select step to visualize:", 0, num_steps - 1, 0)
+                    visualize_step(text, pattern, get_step(step_num), step_num)
+                elif num_steps == 1:
+                    st.caption("Only one step")
+                    visualize_step(text, pattern, get_step(0), 0)
     
     with tab2:
         st.header("Algorithm Implementation")
@@ -287,15 +989,7 @@ print(f"Pattern found at positions: {result}")
         
         # Comparison table
         st.subheader("Algorithm Comparison")
-        comparison_data = {
-            'Algorithm': ['Naïve', 'KMP', 'Boyer-Moore', 'Rabin-Karp'],
-            'Time Complexity': ['O(n×m)', 'O(n+m)', 'O(n/m) best, O(n×m) worst', 'O(n+m) average'],
-            'Space Complexity': ['O(1)', 'O(m)', 'O(m)', 'O(1)'],
-            'Preprocessing': ['None', 'O(m)', 'O(m+σ)', 'O(m)'],
-            'Best Use Case': ['Small patterns', 'General purpose', 'Large alphabets', 'Multiple patterns']
-        }
-        
-        st.dataframe(pd.DataFrame(comparison_data))
+        st.dataframe(_comparison_df())
     
     with tab4:
         generate_performance_chart()
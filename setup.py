@@ -0,0 +1,18 @@
+"""
+Builds the optional _naive_ext accelerator:
+
+    python setup.py build_ext --inplace
+
+The app runs fine without it; final.py falls back to pure Python.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Building the optional extension requires cython: pip install cython")
+
+setup(
+    name='naive-ext',
+    ext_modules=cythonize('_naive_ext.pyx'),
+)